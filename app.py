@@ -0,0 +1,405 @@
+import os
+
+# -------------------- Performance/env tuning (must be set before numpy/onnxruntime load) --------------------
+# One thread per native library; Streamlit already serves sessions from its own threads
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+os.environ.setdefault("MKL_NUM_THREADS", "1")
+os.environ.setdefault("OPENBLAS_NUM_THREADS", "1")
+os.environ.setdefault("KMP_AFFINITY", "disabled")
+os.environ.setdefault("OMP_WAIT_POLICY", "PASSIVE")
+
+import sys
+import shutil
+import datetime
+import threading
+import numpy as np
+import streamlit as st
+import onnxruntime as ort
+from onnxruntime import SessionOptions, GraphOptimizationLevel, ExecutionMode
+
+# -------------------- Model artifacts --------------------
+# Use a pre-optimized artifact from build_model.py if one was built; the repo ships only the raw
+# export, since offline optimization does not change this single-node tree graph.
+MODEL_PATH = "unit2mwbig_model.onnx"
+OPTIMIZED_MODEL_PATH = "unit2mwbig_model.opt.onnx"
+COMPILED_MODEL_PATH = "unit2mwbig_model.so"
+if os.path.exists(OPTIMIZED_MODEL_PATH):
+    MODEL_PATH = OPTIMIZED_MODEL_PATH
+
+# -------------------- Labels --------------------
+labels = {
+    "English": {
+        "title": "Unit 2 Active Power Output Prediction (MW)",
+        "steam": "Steam Flow (Ton/h)",
+        "hrh_p": "HRH Pressure (MPa)",
+        "hrh_t": "HRH Temperature (°C)",
+        "main_p": "Main Steam Pressure (MPa)",
+        "hp_t": "HP Steam Temperature (°C)",
+        "ambient": "Ambient Temperature (°C)",
+        "predict": "Predict",
+        "queue": "Add to Batch",
+        "batch": "Predict Batch",
+        "batch_title": "Batch Scenarios",
+        "batch_result": "Last Batch Result",
+        "remove_last": "Remove Last",
+        "clear_queue": "Clear Queue",
+        "status": "Status",
+        "output": "Predicted Output",
+        "log": "Show Prediction Log",
+        "download": "Download Log as CSV",
+        "saved_log": "Saved Log",
+        "download_saved": "Download Saved Log",
+        "clear": "Clear Log",
+        "designer": "UI Created by Eng. Mohammed Assaf",
+        "model_info": "Model Info",
+        "trained": "Trained Date: 2025-08-20",
+        "algo_onnx": "Algorithm: Random Forest Regressor (ONNX)",
+        "algo_native": "Algorithm: Random Forest Regressor (compiled with Treelite)",
+        "importance": "Input Importance"
+    },
+    "Arabic": {
+        "title": "توقع القدرة الكهربائية الفعالة للوحدة 2 (ميجاواط)",
+        "steam": "تدفق البخار (طن/ساعة)",
+        "hrh_p": "ضغط إعادة التسخين العالي (ميجا باسكال)",
+        "hrh_t": "درجة حرارة إعادة التسخين العالي (°م)",
+        "main_p": "ضغط البخار الرئيسي (ميجا باسكال)",
+        "hp_t": "درجة حرارة البخار العالي (°م)",
+        "ambient": "درجة حرارة الجو (°م)",
+        "predict": "تنبؤ",
+        "queue": "إضافة إلى الدفعة",
+        "batch": "تنبؤ الدفعة",
+        "batch_title": "سيناريوهات الدفعة",
+        "batch_result": "نتيجة آخر دفعة",
+        "remove_last": "حذف الأخير",
+        "clear_queue": "مسح الدفعة",
+        "status": "الحالة",
+        "output": "القيمة المتوقعة",
+        "log": "عرض سجل التنبؤات",
+        "download": "تحميل السجل",
+        "saved_log": "السجل المحفوظ",
+        "download_saved": "تحميل السجل المحفوظ",
+        "clear": "مسح السجل",
+        "designer": "الواجهة التفاعلية إنشاء م. محمد عساف",
+        "model_info": "معلومات النموذج",
+        "trained": "تاريخ التدريب: 2025-08-20",
+        "algo_onnx": "الخوارزمية: غابة عشوائية (ONNX)",
+        "algo_native": "الخوارزمية: غابة عشوائية (مترجمة باستخدام Treelite)",
+        "importance": "أهمية المدخلات"
+    }
+}
+
+# Static model info. A six-item join is cheaper than any cache lookup, so it is a plain constant.
+importance_list = [
+    ("Steam Flow", 0.25), ("HRH P", 0.20), ("HRH T", 0.15),
+    ("Main Steam P", 0.15), ("HP Temp", 0.15), ("Ambient", 0.10)
+]
+IMPORTANCE_MD = "\n".join(f"- **{name}**: {'█' * int(val * 20)} {int(val * 100)}%" for name, val in importance_list)
+
+# Read once per process instead of opening the file on every rerun
+@st.cache_resource(show_spinner=False)
+def logo_bytes():
+    try:
+        with open("OMCO_Logo.png", "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+# -------------------- Optimized ONNX session (cached) --------------------
+@st.cache_resource(show_spinner=False)
+def get_session(path: str):
+    opts = SessionOptions()
+    # The pre-optimized model was already optimized offline; don't redo it at load time
+    if path == OPTIMIZED_MODEL_PATH:
+        opts.graph_optimization_level = GraphOptimizationLevel.ORT_DISABLE_ALL
+    else:
+        opts.graph_optimization_level = GraphOptimizationLevel.ORT_ENABLE_ALL
+    # One row through one TreeEnsemble op: a thread pool's fork/join costs more than it saves
+    opts.intra_op_num_threads = 1
+    # The graph is a single TreeEnsemble op, so inter-op parallelism has nothing to overlap
+    opts.execution_mode = ExecutionMode.ORT_SEQUENTIAL
+    # Requests arrive seconds apart; don't let idle pool threads spin on the CPU
+    opts.add_session_config_entry("session.intra_op.allow_spinning", "0")
+    # Single fixed-shape (1, 6) request per click: the arena and mem-pattern
+    # planner only cost resident memory and first-run time here
+    opts.enable_mem_pattern = False
+    opts.enable_cpu_mem_arena = False
+    providers = [("CPUExecutionProvider", {
+        "intra_op_num_threads": 1
+    })]
+    return ort.InferenceSession(path, sess_options=opts, providers=providers)
+
+@st.cache_resource(show_spinner=False)
+def get_io_names(path: str):
+    sess = get_session(path)
+    return sess.get_inputs()[0].name, sess.get_outputs()[0].name
+
+# -------------------- Compiled predictor (optional, built by build_model.py) --------------------
+@st.cache_resource(show_spinner=False)
+def get_predictor(path: str):
+    if not os.path.exists(path):
+        return None
+    try:
+        import tl2cgen
+        return tl2cgen.Predictor(path, verbose=False)
+    except Exception:
+        return None
+
+def run_onnx(x):
+    input_name, output_name = get_io_names(MODEL_PATH)
+    # An explicit output list avoids ORT collecting every graph output
+    return get_session(MODEL_PATH).run([output_name], {input_name: x})[0]
+
+def get_backend():
+    # The one place that decides the backend order: native tree code, then ONNX Runtime
+    predictor = get_predictor(COMPILED_MODEL_PATH)
+    if predictor is not None:
+        import tl2cgen
+        return "native", lambda x: predictor.predict(tl2cgen.DMatrix(x))
+    return "onnx", run_onnx
+
+def run_model(x):
+    return get_backend()[1](x)
+
+# -------------------- Pre-allocated input + pre-bound I/O for single-row predictions --------------------
+@st.cache_resource(show_spinner=False)
+def get_input_buffer():
+    # Shared by every browser session, so fill/run/read happens under the lock
+    return np.empty((1, 6), dtype=np.float32), threading.Lock()
+
+@st.cache_resource(show_spinner=False)
+def get_io_binding(path: str):
+    input_name, output_name = get_io_names(path)
+    x_buf, _ = get_input_buffer()
+    y_buf = np.zeros((1, 1), dtype=np.float32)
+    binding = get_session(path).io_binding()
+    binding.bind_cpu_input(input_name, x_buf)
+    binding.bind_ortvalue_output(output_name, ort.OrtValue.ortvalue_from_numpy(y_buf))
+    return binding, y_buf
+
+def predict_one(values) -> float:
+    backend, run = get_backend()
+    x_buf, lock = get_input_buffer()
+    with lock:
+        x_buf[0, :] = values
+        if backend != "onnx":
+            return float(run(x_buf).ravel()[0])
+        # ONNX Runtime fast path: the input buffer is already bound to the session
+        binding, y_buf = get_io_binding(MODEL_PATH)
+        get_session(MODEL_PATH).run_with_iobinding(binding)
+        return float(y_buf[0, 0])
+
+# Slider values are discrete steps, so the same inputs come back often; skip the model for those
+@st.cache_data(show_spinner=False, max_entries=1024)
+def predict_cached(steam: float, hrh_p: float, hrh_t: float, main_p: float, hp_t: float, amb: float) -> float:
+    return predict_one((steam, hrh_p, hrh_t, main_p, hp_t, amb))
+
+# -------------------- Logging --------------------
+LOG_COLUMNS = ["Time", "Steam Flow", "HRH P", "HRH T", "Main Steam P", "HP Temp", "Ambient", "Predicted MW"]
+LOG_PATH = "unit2_log"  # Parquet dataset directory, one part file per flush
+LEGACY_LOG_PATH = "unit2_log.csv"  # CSV log written by earlier versions of the app
+
+def append_log(rows):
+    # Kept in memory for this browser session; nothing touches the disk on the prediction path
+    st.session_state.setdefault("log_rows", []).extend(rows)
+
+def _log_schema():
+    import pyarrow as pa
+    return pa.schema([("Time", pa.string())] + [(c, pa.float64()) for c in LOG_COLUMNS[1:]])
+
+def _write_log_part(table, name: str):
+    import pyarrow.parquet as pq
+    os.makedirs(LOG_PATH, exist_ok=True)
+    # Write under a dot-prefixed name (skipped by the dataset reader), then rename into place
+    # so a concurrent load_log never sees a half-written part file
+    tmp_path = os.path.join(LOG_PATH, f".{name}.tmp")
+    pq.write_table(table, tmp_path)
+    os.replace(tmp_path, os.path.join(LOG_PATH, name))
+
+def migrate_legacy_log():
+    # One-time import of the old CSV history into the Parquet dataset. It only runs while the
+    # dataset does not exist yet; the CSV is then renamed so it is not imported twice.
+    if os.path.exists(LOG_PATH) or not os.path.exists(LEGACY_LOG_PATH):
+        return
+    try:
+        import pandas as pd
+        import pyarrow as pa
+        df = pd.read_csv(LEGACY_LOG_PATH, dtype={"Time": str})
+        table = pa.Table.from_pandas(df[LOG_COLUMNS], schema=_log_schema(), preserve_index=False)
+        _write_log_part(table, "part-legacy.parquet")
+        os.replace(LEGACY_LOG_PATH, LEGACY_LOG_PATH + ".migrated")
+    except FileNotFoundError:
+        pass  # another session finished the migration first
+    except Exception as e:
+        st.warning(f"Could not import {LEGACY_LOG_PATH}: {e}")
+
+def flush_log():
+    # Write rows not yet saved as a new Parquet part file in one go (runs when the log is downloaded)
+    rows = st.session_state.get("log_rows", [])
+    saved = st.session_state.get("log_saved", 0)
+    if saved >= len(rows):
+        return
+    # Must run before this flush creates the dataset directory
+    migrate_legacy_log()
+    try:
+        import pyarrow as pa
+        columns = [list(col) for col in zip(*rows[saved:])]
+        table = pa.Table.from_arrays(columns, schema=_log_schema())
+        part = datetime.datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+        _write_log_part(table, f"part-{part}.parquet")
+        st.session_state["log_saved"] = len(rows)
+    except Exception as e:
+        st.warning(f"Could not write log: {e}")
+
+# Keyed on the log directory's mtime, which changes whenever a flush adds a part file
+@st.cache_data(show_spinner=False)
+def load_log(path: str, mtime: float):
+    import pandas as pd
+    try:
+        return pd.read_parquet(path)
+    except Exception:
+        return None
+
+@st.cache_data(show_spinner=False)
+def log_csv_bytes(path: str, mtime: float):
+    return load_log(path, mtime).to_csv(index=False).encode("utf-8")
+
+
+def main():
+    # -------------------- Page Configuration --------------------
+    st.set_page_config(page_title="Unit 2 MW Prediction", layout="centered")
+    st.caption(f"Python: {sys.version.split()[0]}")
+    st.caption(f"ONNX Runtime: {ort.__version__} | Providers: {ort.get_available_providers()}")
+
+    # Ensure the model file is present where the app expects it
+    if not os.path.exists(MODEL_PATH):
+        st.error(f"Model file not found: {MODEL_PATH}. Check file name/location in the repo root.")
+        st.stop()
+
+    # -------------------- Language Toggle --------------------
+    LANG = st.selectbox("🌐 Language / اللغة", ["English", "Arabic"])
+    l = labels[LANG]
+
+    # -------------------- Logo --------------------
+    logo = logo_bytes()
+    if logo is not None:
+        st.image(logo, width=250)
+    else:
+        st.info("Logo not found (OMCO_Logo.png)")
+
+    # -------------------- Title and Designer --------------------
+    st.title(f"⚡ {l['title']}")
+    st.markdown(f"<div style='text-align: center;'><strong>{l['designer']}</strong></div>", unsafe_allow_html=True)
+
+    # -------------------- Input Form (prevents rerun on every slider move) --------------------
+    with st.form("predict_form"):
+        col1, col2 = st.columns(2)
+        with col1:
+            steam_flow = st.slider(l["steam"], 180.0, 910.0, 850.0)
+            hrh_p      = st.slider(l["hrh_p"], 1.2, 4.39, 4.0)
+            hrh_t      = st.slider(l["hrh_t"], 390, 540, 525)
+        with col2:
+            main_p     = st.slider(l["main_p"], 7.0, 17.39, 16.0)
+            hp_t       = st.slider(l["hp_t"], 390, 540, 538)
+            ambient    = st.slider(l["ambient"], -4.0, 50.0, 25.0)
+        bcol1, bcol2 = st.columns(2)
+        with bcol1:
+            submitted = st.form_submit_button(l["predict"])  # only submits once
+        with bcol2:
+            queued = st.form_submit_button("➕ " + l["queue"])
+
+    # -------------------- Prediction --------------------
+    scenario = (steam_flow, hrh_p, hrh_t, main_p, hp_t, ambient)
+
+    if submitted:
+        predicted_mw = predict_cached(*scenario)
+        clipped_result = max(min(predicted_mw, 290.0), 140.0)
+
+        st.markdown(f"<h2 style='color:darkblue;'>{l['output']}: {clipped_result:.2f} MW</h2>", unsafe_allow_html=True)
+
+        append_log([[datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"), *scenario, clipped_result]])
+
+    # -------------------- Batch Prediction (one model call for all queued scenarios) --------------------
+    pending = st.session_state.setdefault("pending", [])
+    if queued:
+        pending.append(scenario)
+
+    if pending:
+        import pandas as pd
+        st.markdown(f"**{l['batch_title']}: {len(pending)}**")
+        st.dataframe(pd.DataFrame(pending, columns=LOG_COLUMNS[1:-1]))
+        qcol1, qcol2, qcol3 = st.columns(3)
+        with qcol1:
+            run_batch = st.button("⚡ " + l["batch"])
+        with qcol2:
+            remove_last = st.button("↩️ " + l["remove_last"])
+        with qcol3:
+            clear_queue = st.button("🗑️ " + l["clear_queue"])
+        if run_batch:
+            X = np.asarray(pending, dtype=np.float32)
+            clipped = np.clip(np.asarray(run_model(X), dtype=np.float64).ravel(), 140.0, 290.0)
+            now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            rows = [[now, *row, float(mw)] for row, mw in zip(pending, clipped)]
+            # Kept in session state so the result survives the rerun below and later ones
+            st.session_state["batch_result"] = rows
+            append_log(rows)
+            pending.clear()
+        elif remove_last:
+            pending.pop()
+        elif clear_queue:
+            pending.clear()
+        if run_batch or remove_last or clear_queue:
+            st.rerun()  # redraw the queue from its new state
+
+    batch_result = st.session_state.get("batch_result")
+    if batch_result:
+        import pandas as pd
+        st.markdown(f"**{l['batch_result']}**")
+        st.dataframe(pd.DataFrame(batch_result, columns=LOG_COLUMNS).drop(columns="Time"))
+
+    # -------------------- Log Viewer --------------------
+    st.markdown("---")
+    show_log = st.checkbox(l["log"])
+
+    if show_log:
+        log_rows = st.session_state.get("log_rows", [])
+        if log_rows:
+            import pandas as pd
+            df_log = pd.DataFrame(log_rows, columns=LOG_COLUMNS)
+            st.dataframe(df_log)
+            csv_bytes = df_log.to_csv(index=False).encode("utf-8")
+            st.download_button(label="📥 " + l["download"], data=csv_bytes, file_name="unit2_log.csv", mime="text/csv", on_click=flush_log)
+        else:
+            st.info("📭 No predictions logged yet.")
+
+        migrate_legacy_log()
+        if os.path.exists(LOG_PATH):
+            mtime = os.path.getmtime(LOG_PATH)
+            df_saved = load_log(LOG_PATH, mtime)
+            if df_saved is not None:
+                st.markdown(f"**{l['saved_log']}**")
+                st.dataframe(df_saved)
+                st.download_button(label="📥 " + l["download_saved"], data=log_csv_bytes(LOG_PATH, mtime), file_name="unit2_log.csv", mime="text/csv")
+
+    # -------------------- Clear Log --------------------
+    if st.button("🧹 " + l["clear"]):
+        st.session_state["log_rows"] = []
+        st.session_state["log_saved"] = 0
+        try:
+            if os.path.exists(LOG_PATH):
+                shutil.rmtree(LOG_PATH)
+            st.success("✅ Log cleared successfully.")
+        except Exception as e:
+            st.warning(f"Could not clear log: {e}")
+
+    # -------------------- Model Info --------------------
+    st.markdown("---")
+    with st.expander(l["model_info"]):
+        st.write(f"📅 {l['trained']}")
+        # Name the backend that actually serves predictions
+        st.write(f"🧠 {l['algo_' + get_backend()[0]]}")
+        st.markdown(f"**{l['importance']}:**")
+        st.markdown(IMPORTANCE_MD)
+
+
+if __name__ == "__main__":
+    main()
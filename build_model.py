@@ -0,0 +1,141 @@
+"""Offline build step for the Unit 2 MW model artifacts.
+
+Run once after (re)training, next to the app:
+
+    python build_model.py
+
+Produces:
+  * ``unit2mwbig_model.opt.onnx``: the graph after ONNX Runtime's extended
+    optimization pass (``ORT_ENABLE_ALL`` can bake hardware specific layouts
+    into the file), which the app loads with optimizations disabled if present.
+    For the current model this is not shipped: the graph is a single
+    TreeEnsembleRegressor node with nothing to rewrite, the output has the same
+    size (18.2 MB) and session creation takes ~0.54 s either way. Rebuild and
+    measure again if the model gains more operators.
+  * ``unit2mwbig_model.so``: the same forest compiled to native code with
+    Treelite/TL2cgen. Needs ``onnx``, ``treelite`` and ``tl2cgen`` installed and
+    a C compiler; the library is platform specific, so build it on the machine
+    that serves the app (``*.so`` is not committed). Skipped if those packages
+    are missing.
+"""
+import numpy as np
+import onnxruntime as ort
+from onnxruntime import SessionOptions, GraphOptimizationLevel
+
+MODEL_PATH = "unit2mwbig_model.onnx"
+OPTIMIZED_MODEL_PATH = "unit2mwbig_model.opt.onnx"
+COMPILED_MODEL_PATH = "unit2mwbig_model.so"
+
+# One representative row inside the slider ranges used by the app
+SAMPLE_ROW = [850.0, 4.0, 525.0, 16.0, 538.0, 25.0]
+
+
+def optimize(src: str, dst: str):
+    opts = SessionOptions()
+    opts.graph_optimization_level = GraphOptimizationLevel.ORT_ENABLE_EXTENDED
+    # ORT writes the optimized graph while constructing the session
+    opts.optimized_model_filepath = dst
+    ort.InferenceSession(src, sess_options=opts, providers=["CPUExecutionProvider"])
+    print(f"Wrote {dst}")
+
+
+# ONNX branch modes -> Treelite comparison operators (test true => left child)
+BRANCH_OPS = {
+    "BRANCH_LEQ": "<=",
+    "BRANCH_LT": "<",
+    "BRANCH_GTE": ">=",
+    "BRANCH_GT": ">",
+    "BRANCH_EQ": "==",
+}
+
+
+def _tree_ensemble_attrs(path: str):
+    import onnx
+    from onnx import helper
+
+    model = onnx.load(path)
+    for node in model.graph.node:
+        if node.op_type == "TreeEnsembleRegressor":
+            attrs = {a.name: helper.get_attribute_value(a) for a in node.attribute}
+            # Newer exporters may store float arrays as tensors
+            for key in ("nodes_values", "target_weights", "base_values"):
+                if key + "_as_tensor" in attrs:
+                    attrs[key] = onnx.numpy_helper.to_array(attrs.pop(key + "_as_tensor")).tolist()
+            return attrs
+    raise ValueError(f"No TreeEnsembleRegressor node found in {path}")
+
+
+def compile_native(src: str, dst: str):
+    try:
+        import tl2cgen
+        from treelite.model_builder import Metadata, ModelBuilder, PostProcessorFunc, TreeAnnotation
+    except ImportError as e:
+        print(f"Skipping native compilation ({e})")
+        return
+
+    a = _tree_ensemble_attrs(src)
+    modes = [m.decode() if isinstance(m, bytes) else m for m in a["nodes_modes"]]
+    missing_true = a.get("nodes_missing_value_tracks_true", [0] * len(modes))
+    leaf_values = {
+        (t, n): w for t, n, w in zip(a["target_treeids"], a["target_nodeids"], a["target_weights"])
+    }
+    tree_ids = sorted(set(a["nodes_treeids"]))
+    base_values = a.get("base_values") or [0.0]
+    aggregate = a.get("aggregate_function", b"SUM")
+    aggregate = aggregate.decode() if isinstance(aggregate, bytes) else aggregate
+
+    builder = ModelBuilder(
+        threshold_type="float32",
+        leaf_output_type="float32",
+        metadata=Metadata(
+            num_feature=len(SAMPLE_ROW),
+            task_type="kRegressor",
+            average_tree_output=aggregate == "AVERAGE",
+            num_target=1,
+            num_class=[1],
+            leaf_vector_shape=(1, 1),
+        ),
+        tree_annotation=TreeAnnotation(
+            num_tree=len(tree_ids), target_id=[0] * len(tree_ids), class_id=[0] * len(tree_ids)
+        ),
+        postprocessor=PostProcessorFunc(name="identity"),
+        base_scores=[float(base_values[0])],
+    )
+
+    # Group node indices by tree, root (node id 0) first
+    nodes_by_tree = {t: [] for t in tree_ids}
+    for i, t in enumerate(a["nodes_treeids"]):
+        nodes_by_tree[t].append(i)
+    for t in tree_ids:
+        builder.start_tree()
+        for i in sorted(nodes_by_tree[t], key=lambda i: a["nodes_nodeids"][i]):
+            builder.start_node(a["nodes_nodeids"][i])
+            if modes[i] == "LEAF":
+                builder.leaf(float(leaf_values[(t, a["nodes_nodeids"][i])]))
+            else:
+                builder.numerical_test(
+                    feature_id=a["nodes_featureids"][i],
+                    threshold=float(a["nodes_values"][i]),
+                    default_left=bool(missing_true[i]),
+                    opname=BRANCH_OPS[modes[i]],
+                    left_child_key=a["nodes_truenodeids"][i],
+                    right_child_key=a["nodes_falsenodeids"][i],
+                )
+            builder.end_node()
+        builder.end_tree()
+    model = builder.commit()
+
+    # quantize=1 maps thresholds to small integer indices for tighter, cache-friendly code
+    tl2cgen.export_lib(model, toolchain="gcc", libpath=dst, params={"parallel_comp": 32, "quantize": 1})
+
+    # Sanity check against ONNX Runtime on the sample row
+    x = np.array([SAMPLE_ROW], dtype=np.float32)
+    session = ort.InferenceSession(src, providers=["CPUExecutionProvider"])
+    expected = float(session.run(None, {session.get_inputs()[0].name: x})[0].ravel()[0])
+    got = float(tl2cgen.Predictor(dst).predict(tl2cgen.DMatrix(x)).ravel()[0])
+    print(f"Wrote {dst} (ONNX {expected:.3f} MW vs native {got:.3f} MW)")
+
+
+if __name__ == "__main__":
+    optimize(MODEL_PATH, OPTIMIZED_MODEL_PATH)
+    compile_native(MODEL_PATH, COMPILED_MODEL_PATH)